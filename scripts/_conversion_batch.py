@@ -0,0 +1,88 @@
+"""Shared --input-glob batch mode for the conversation conversion scripts."""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import sys
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TextIO
+
+
+def positive_int(value: str) -> int:
+    """Argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
+def add_batch_arguments(parser: argparse.ArgumentParser, *, source: str) -> None:
+    """Register --input-glob, --output-dir and --jobs on a conversion parser."""
+    parser.add_argument(
+        "--input-glob",
+        help=f"Glob of {source} files to convert in parallel (requires --output-dir).",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        help="Directory for per-file conversation JSON (<input stem>.json) with --input-glob.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        help="Worker processes for --input-glob. Defaults to the CPU count.",
+    )
+
+
+def batch_inputs(parser: argparse.ArgumentParser, args: argparse.Namespace) -> list[Path]:
+    """Validate batch arguments and expand --input-glob into sorted input paths."""
+    if args.input or args.output:
+        parser.error("--input-glob cannot be combined with input or --output")
+    if not args.output_dir:
+        parser.error("--input-glob requires --output-dir")
+    inputs = sorted(Path(match) for match in glob.glob(args.input_glob, recursive=True))
+    if not inputs:
+        parser.error(f"No files match --input-glob {args.input_glob!r}")
+    if len({path.stem for path in inputs}) != len(inputs):
+        parser.error("--input-glob matched files with the same name; outputs would collide")
+    return inputs
+
+
+def convert_batch(
+    convert_to_file: Callable[[Path, Path], int],
+    inputs: list[Path],
+    output_dir: Path,
+    *,
+    jobs: int | None,
+    status_stream: TextIO,
+) -> int:
+    """Convert independent input files in worker processes.
+
+    ``convert_to_file`` must be picklable (a module-level function or a
+    ``functools.partial`` of one). Each worker reads and writes its own
+    files, so only paths cross the process boundary.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    failures = 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = []
+        for input_path in inputs:
+            output_path = output_dir / f"{input_path.stem}.json"
+            future = pool.submit(convert_to_file, input_path, output_path)
+            futures.append((input_path, output_path, future))
+        for input_path, output_path, future in futures:
+            try:
+                count = future.result()
+            except (OSError, ValueError) as exc:
+                failures += 1
+                print(f"Failed to convert {input_path}: {exc}", file=sys.stderr)
+                continue
+            print(f"Wrote {count} messages to {output_path}", file=status_stream)
+    return 1 if failures else 0
@@ -10,25 +10,32 @@ Input format (live/non-session):
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
 import json
 import re
+import sys
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
+from _conversion_batch import add_batch_arguments, batch_inputs, convert_batch
 
-def _iter_jsonl(path: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    for idx, raw in enumerate(path.read_text(encoding="utf-8").splitlines(), 1):
-        if not raw.strip():
-            continue
-        try:
-            obj = json.loads(raw)
-        except json.JSONDecodeError as exc:
-            raise ValueError(f"Invalid JSON at line {idx}: {exc}") from exc
-        if isinstance(obj, dict):
-            rows.append(obj)
-    return rows
+
+def _iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open("rb") as handle:
+        for idx, raw in enumerate(handle, 1):
+            if not raw.strip():
+                continue
+            try:
+                obj = json.loads(raw)
+            except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+                raise ValueError(f"Invalid JSON at line {idx}: {exc}") from exc
+            if isinstance(obj, dict):
+                yield obj
+
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
 
 
 def _serialize_any(value: Any) -> str:
@@ -36,25 +43,32 @@ def _serialize_any(value: Any) -> str:
         return value
     if value is None:
         return ""
-    return json.dumps(value, ensure_ascii=False)
+    return _JSON_ENCODER.encode(value)
 
 
-_FILE_TOKEN_RE = re.compile(r"(?P<path>(?:[A-Za-z0-9._-]+/)*[A-Za-z0-9._-]+\.[A-Za-z0-9]+)")
+# The lookbehind anchors matches at token starts; without it a long run of
+# path characters is rescanned from every offset (quadratic).
+_FILE_TOKEN_RE = re.compile(
+    r"(?<![A-Za-z0-9._-])(?P<path>(?:[A-Za-z0-9._-]+/)*[A-Za-z0-9._-]+\.[A-Za-z0-9]+)"
+)
+_MULTI_SLASH_RE = re.compile(r"/{2,}")
+_REPO_ROOT_MARKER = "/Projects/normcore/"
 
 
 def _normalize_repo_rel_path(path: str) -> str:
     cleaned = path.strip().strip("'\"")
     cleaned = cleaned.replace("\\", "/")
-    if "/Projects/normcore/" in cleaned:
-        cleaned = cleaned.split("/Projects/normcore/", 1)[1]
+    if _REPO_ROOT_MARKER in cleaned:
+        cleaned = cleaned.split(_REPO_ROOT_MARKER, 1)[1]
     if cleaned.startswith("./"):
         cleaned = cleaned[2:]
-    cleaned = re.sub(r"/{2,}", "/", cleaned)
+    if "//" in cleaned:
+        cleaned = _MULTI_SLASH_RE.sub("/", cleaned)
     return cleaned
 
 
 def _extract_repo_file_path(command: str) -> str | None:
-    if not command:
+    if not command or "." not in command:
         return None
     for match in _FILE_TOKEN_RE.finditer(command):
         candidate = _normalize_repo_rel_path(match.group("path"))
@@ -62,8 +76,6 @@ def _extract_repo_file_path(command: str) -> str | None:
             continue
         if candidate.startswith("-"):
             continue
-        if "*" in candidate or "?" in candidate:
-            continue
         if candidate.endswith(".pyc"):
             continue
         if candidate.startswith(".venv/"):
@@ -72,25 +84,49 @@ def _extract_repo_file_path(command: str) -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def _file_citation_key(repo_rel_path: str) -> str:
+    # Keep sha256: agents compute `[@file_<hash12>]` keys themselves (see README).
     digest = hashlib.sha256(repo_rel_path.encode("utf-8")).hexdigest()[:12]
     return f"file_{digest}"
 
 
+@functools.lru_cache(maxsize=1024)
+def _dump_command_args(command: str) -> str:
+    return _JSON_ENCODER.encode({"command": command})
+
+
+def _shell_call_messages(
+    tool_call_id: str, arguments: str, output: str
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    assistant_message = {
+        "role": "assistant",
+        "content": "",
+        "tool_calls": [
+            {
+                "id": tool_call_id,
+                "type": "function",
+                "function": {"name": "shell_command", "arguments": arguments},
+            }
+        ],
+    }
+    tool_message = {"role": "tool", "tool_call_id": tool_call_id, "content": output}
+    return assistant_message, tool_message
+
+
 def convert_codex_exec_events(
     path: Path,
     *,
     user_prompt: str | None = None,
     include_reasoning: bool = False,
 ) -> list[dict[str, Any]]:
-    rows = _iter_jsonl(path)
     conversation: list[dict[str, Any]] = []
     pending_command_by_item_id: dict[str, str] = {}
 
     if user_prompt and user_prompt.strip():
         conversation.append({"role": "user", "content": user_prompt.strip()})
 
-    for row in rows:
+    for row in _iter_jsonl(path):
         row_type = row.get("type")
         item = row.get("item")
         if not isinstance(item, dict):
@@ -133,45 +169,70 @@ def convert_codex_exec_events(
             else:
                 tool_call_id = f"codex_cmd_{item_id or 'unknown'}"
 
-            conversation.append(
-                {
-                    "role": "assistant",
-                    "content": "",
-                    "tool_calls": [
-                        {
-                            "id": tool_call_id,
-                            "type": "function",
-                            "function": {
-                                "name": "shell_command",
-                                "arguments": json.dumps({"command": command}, ensure_ascii=False),
-                            },
-                        }
-                    ],
-                }
-            )
-            conversation.append(
-                {
-                    "role": "tool",
-                    "tool_call_id": tool_call_id,
-                    "content": aggregated_output,
-                }
+            conversation.extend(
+                _shell_call_messages(
+                    tool_call_id,
+                    _dump_command_args(command),
+                    aggregated_output,
+                )
             )
             continue
 
     return conversation
 
 
+def _conversation_error(
+    conversation: list[dict[str, Any]], *, allow_non_assistant_last: bool
+) -> str | None:
+    if not conversation:
+        return "No convertible events found in codex exec stream."
+    if not allow_non_assistant_last and conversation[-1].get("role") != "assistant":
+        return "Last message is not assistant; this will fail evaluate(conversation=...)."
+    return None
+
+
+def _dump_conversation(conversation: list[dict[str, Any]], handle: TextIO) -> None:
+    json.dump(conversation, handle, ensure_ascii=False, indent=2)
+    handle.write("\n")
+
+
+def _write_conversation(conversation: list[dict[str, Any]], output: Path) -> None:
+    with output.open("w", encoding="utf-8") as handle:
+        _dump_conversation(conversation, handle)
+
+
+def _convert_to_file(
+    input_path: Path,
+    output_path: Path,
+    *,
+    user_prompt: str | None,
+    include_reasoning: bool,
+    allow_non_assistant_last: bool,
+) -> int:
+    conversation = convert_codex_exec_events(
+        input_path,
+        user_prompt=user_prompt,
+        include_reasoning=include_reasoning,
+    )
+    error = _conversation_error(conversation, allow_non_assistant_last=allow_non_assistant_last)
+    if error:
+        raise ValueError(error)
+    _write_conversation(conversation, output_path)
+    return len(conversation)
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Convert codex exec JSONL events to NormCore conversation JSON."
     )
-    parser.add_argument("input", type=Path, help="Path to codex exec JSONL output.")
+    parser.add_argument("input", type=Path, nargs="?", help="Path to codex exec JSONL output.")
     parser.add_argument(
         "-o",
         "--output",
         type=Path,
         help="Output path for conversation JSON. Defaults to stdout.",
     )
+    add_batch_arguments(parser, source="codex exec JSONL")
     parser.add_argument(
         "--user-prompt",
         help="Optional user prompt text to prepend as the first user message.",
@@ -188,24 +249,39 @@ def main(argv: list[str] | None = None) -> int:
     )
     args = parser.parse_args(argv)
 
+    if args.input_glob:
+        convert_to_file = functools.partial(
+            _convert_to_file,
+            user_prompt=args.user_prompt,
+            include_reasoning=args.include_reasoning,
+            allow_non_assistant_last=args.allow_non_assistant_last,
+        )
+        return convert_batch(
+            convert_to_file,
+            batch_inputs(parser, args),
+            args.output_dir,
+            jobs=args.jobs,
+            status_stream=sys.stdout,
+        )
+    if args.input is None:
+        parser.error("input is required unless --input-glob is given")
+
     conversation = convert_codex_exec_events(
         args.input,
         user_prompt=args.user_prompt,
         include_reasoning=args.include_reasoning,
     )
-    if not conversation:
-        raise SystemExit("No convertible events found in codex exec stream.")
-    if not args.allow_non_assistant_last and conversation[-1].get("role") != "assistant":
-        raise SystemExit(
-            "Last message is not assistant; this will fail evaluate(conversation=...)."
-        )
+    error = _conversation_error(
+        conversation, allow_non_assistant_last=args.allow_non_assistant_last
+    )
+    if error:
+        raise SystemExit(error)
 
-    rendered = json.dumps(conversation, ensure_ascii=False, indent=2)
     if args.output:
-        args.output.write_text(rendered + "\n", encoding="utf-8")
+        _write_conversation(conversation, args.output)
         print(f"Wrote {len(conversation)} messages to {args.output}")
     else:
-        print(rendered)
+        _dump_conversation(conversation, sys.stdout)
     return 0
 
 
@@ -6,25 +6,29 @@ Convert Codex rollout JSONL into a NormCore-compatible conversation JSON.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
+from _conversion_batch import add_batch_arguments, batch_inputs, convert_batch
 
-def _iter_jsonl(path: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    for idx, raw in enumerate(path.read_text(encoding="utf-8").splitlines(), 1):
-        if not raw.strip():
-            continue
-        try:
-            obj = json.loads(raw)
-        except json.JSONDecodeError as exc:
-            raise ValueError(f"Invalid JSON at line {idx}: {exc}") from exc
-        if not isinstance(obj, dict):
-            continue
-        rows.append(obj)
-    return rows
+_CONVERSATION_ROW_TYPES = frozenset({"event_msg", "response_item"})
+
+
+def _iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open("rb") as handle:
+        for idx, raw in enumerate(handle, 1):
+            if not raw.strip():
+                continue
+            try:
+                obj = json.loads(raw)
+            except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+                raise ValueError(f"Invalid JSON at line {idx}: {exc}") from exc
+            if isinstance(obj, dict):
+                yield obj
 
 
 def _extract_message_text(payload: dict[str, Any]) -> str:
@@ -42,42 +46,34 @@ def _extract_message_text(payload: dict[str, Any]) -> str:
     return "\n".join(text_parts).strip()
 
 
-def _from_event_messages(rows: list[dict[str, Any]]) -> list[dict[str, str]]:
-    conversation: list[dict[str, str]] = []
-    for row in rows:
-        if row.get("type") != "event_msg":
-            continue
-        payload = row.get("payload")
-        if not isinstance(payload, dict):
-            continue
-        kind = payload.get("type")
-        if kind not in {"user_message", "agent_message"}:
-            continue
-        message = payload.get("message")
-        if not isinstance(message, str) or not message.strip():
-            continue
-        role = "user" if kind == "user_message" else "assistant"
-        conversation.append({"role": role, "content": message})
-    return conversation
+def _event_message(row_type: str, payload: dict[str, Any]) -> dict[str, str] | None:
+    if row_type != "event_msg":
+        return None
+    kind = payload.get("type")
+    if kind not in {"user_message", "agent_message"}:
+        return None
+    message = payload.get("message")
+    if not isinstance(message, str) or not message.strip():
+        return None
+    role = "user" if kind == "user_message" else "assistant"
+    return {"role": role, "content": message}
 
 
-def _from_response_messages(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    conversation: list[dict[str, Any]] = []
-    for row in rows:
-        if row.get("type") != "response_item":
-            continue
-        payload = row.get("payload")
-        if not isinstance(payload, dict):
-            continue
-        if payload.get("type") != "message":
-            continue
-        role = payload.get("role")
-        if role not in {"user", "assistant"}:
-            continue
-        text = _extract_message_text(payload)
-        if text:
-            conversation.append({"role": role, "content": text})
-    return conversation
+def _response_message(row_type: str, payload: dict[str, Any]) -> dict[str, Any] | None:
+    if row_type != "response_item":
+        return None
+    if payload.get("type") != "message":
+        return None
+    role = payload.get("role")
+    if role not in {"user", "assistant"}:
+        return None
+    text = _extract_message_text(payload)
+    if not text:
+        return None
+    return {"role": role, "content": text}
+
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
 
 
 def _serialize_any(value: Any) -> str:
@@ -85,52 +81,67 @@ def _serialize_any(value: Any) -> str:
         return value
     if value is None:
         return ""
-    return json.dumps(value, ensure_ascii=False)
+    return _JSON_ENCODER.encode(value)
+
+
+class _EventMessagesConversation:
+    """Build conversation from user/assistant event messages only."""
+
+    def __init__(self) -> None:
+        self.conversation: list[dict[str, Any]] = []
+
+    def feed(self, row_type: str, payload: dict[str, Any]) -> None:
+        message = _event_message(row_type, payload)
+        if message is not None:
+            self.conversation.append(message)
+
+    def finish(self) -> list[dict[str, Any]]:
+        return self.conversation
 
 
-def _from_event_and_tools(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+class _EventToolsConversation:
     """
     Build conversation from user/assistant event messages + tool traces.
 
     Tool traces are reconstructed from response_item(function_call +
     function_call_output) records as OpenAI-style assistant/tool messages.
     """
-    conversation: list[dict[str, Any]] = []
-    started = False
-    pending_event_agent: str | None = None
 
-    for row in rows:
-        row_type = row.get("type")
-        payload = row.get("payload")
-        if not isinstance(payload, dict):
-            continue
+    def __init__(self) -> None:
+        self.conversation: list[dict[str, Any]] = []
+        self._started = False
+        self._pending_event_agent: str | None = None
 
+    def feed(self, row_type: str, payload: dict[str, Any]) -> None:
+        conversation = self.conversation
         if row_type == "event_msg":
             kind = payload.get("type")
             if kind == "user_message":
                 message = payload.get("message")
                 if isinstance(message, str) and message.strip():
-                    started = True
-                    if pending_event_agent:
-                        conversation.append({"role": "assistant", "content": pending_event_agent})
-                        pending_event_agent = None
+                    self._started = True
+                    if self._pending_event_agent:
+                        conversation.append(
+                            {"role": "assistant", "content": self._pending_event_agent}
+                        )
+                        self._pending_event_agent = None
                     conversation.append({"role": "user", "content": message})
-                continue
-            if kind == "agent_message" and started:
+                return
+            if kind == "agent_message" and self._started:
                 message = payload.get("message")
                 if isinstance(message, str) and message.strip():
-                    pending_event_agent = message
-                continue
+                    self._pending_event_agent = message
+                return
 
-        if not started or row_type != "response_item":
-            continue
+        if not self._started or row_type != "response_item":
+            return
 
         item_type = payload.get("type")
         if item_type == "function_call":
             call_id = payload.get("call_id")
             name = payload.get("name")
             if not isinstance(call_id, str) or not isinstance(name, str):
-                continue
+                return
             arguments = _serialize_any(payload.get("arguments"))
             conversation.append(
                 {
@@ -145,46 +156,109 @@ def _from_event_and_tools(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
                     ],
                 }
             )
-            continue
+            return
 
         if item_type == "function_call_output":
             call_id = payload.get("call_id")
             if not isinstance(call_id, str):
-                continue
+                return
             output = _serialize_any(payload.get("output"))
             conversation.append({"role": "tool", "tool_call_id": call_id, "content": output})
-            continue
+            return
 
         if item_type == "message" and payload.get("role") == "assistant":
             text = _extract_message_text(payload)
             if text:
                 conversation.append({"role": "assistant", "content": text})
-                pending_event_agent = None
+                self._pending_event_agent = None
 
-    if pending_event_agent:
-        conversation.append({"role": "assistant", "content": pending_event_agent})
-    return conversation
+    def finish(self) -> list[dict[str, Any]]:
+        if self._pending_event_agent:
+            self.conversation.append({"role": "assistant", "content": self._pending_event_agent})
+            self._pending_event_agent = None
+        return self.conversation
 
 
 def convert_rollout(path: Path, include_tools: bool = True) -> list[dict[str, Any]]:
-    rows = _iter_jsonl(path)
-    conversation = _from_event_and_tools(rows) if include_tools else _from_event_messages(rows)
-    if conversation:
+    """
+    Convert a rollout in a single streaming pass.
+
+    The response_item message fallback is collected alongside the primary
+    event-based conversation and dropped as soon as the primary one yields a
+    message (it only grows, so the fallback can no longer be selected).
+    """
+    primary = _EventToolsConversation() if include_tools else _EventMessagesConversation()
+    fallback: list[dict[str, Any]] | None = []
+    for row in _iter_jsonl(path):
+        row_type = row.get("type")
+        if row_type not in _CONVERSATION_ROW_TYPES:
+            continue
+        payload = row.get("payload")
+        if not isinstance(payload, dict):
+            continue
+        primary.feed(row_type, payload)
+        if fallback is None:
+            continue
+        if primary.conversation:
+            fallback = None
+            continue
+        message = _response_message(row_type, payload)
+        if message is not None:
+            fallback.append(message)
+
+    conversation = primary.finish()
+    if conversation or fallback is None:
         return conversation
-    return _from_response_messages(rows)
+    return fallback
+
+
+def _conversation_error(
+    conversation: list[dict[str, Any]], *, allow_non_assistant_last: bool
+) -> str | None:
+    if not conversation:
+        return "No user/assistant messages found in rollout."
+    if not allow_non_assistant_last and conversation[-1].get("role") != "assistant":
+        return "Last message is not assistant; this will fail evaluate(conversation=...)."
+    return None
+
+
+def _dump_conversation(conversation: list[dict[str, Any]], handle: TextIO) -> None:
+    json.dump(conversation, handle, ensure_ascii=False, indent=2)
+    handle.write("\n")
+
+
+def _write_conversation(conversation: list[dict[str, Any]], output: Path) -> None:
+    with output.open("w", encoding="utf-8") as handle:
+        _dump_conversation(conversation, handle)
+
+
+def _convert_to_file(
+    input_path: Path,
+    output_path: Path,
+    *,
+    include_tools: bool,
+    allow_non_assistant_last: bool,
+) -> int:
+    conversation = convert_rollout(input_path, include_tools=include_tools)
+    error = _conversation_error(conversation, allow_non_assistant_last=allow_non_assistant_last)
+    if error:
+        raise ValueError(error)
+    _write_conversation(conversation, output_path)
+    return len(conversation)
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Convert rollout JSONL into NormCore conversation JSON."
     )
-    parser.add_argument("input", type=Path, help="Path to rollout JSONL file.")
+    parser.add_argument("input", type=Path, nargs="?", help="Path to rollout JSONL file.")
     parser.add_argument(
         "-o",
         "--output",
         type=Path,
         help="Output path for conversation JSON. Defaults to stdout.",
     )
+    add_batch_arguments(parser, source="rollout JSONL")
     parser.add_argument(
         "--messages-only",
         action="store_true",
@@ -197,23 +271,37 @@ def main(argv: list[str] | None = None) -> int:
     )
     args = parser.parse_args(argv)
 
-    conversation = convert_rollout(args.input, include_tools=not args.messages_only)
-    if not conversation:
-        raise SystemExit("No user/assistant messages found in rollout.")
-    if not args.allow_non_assistant_last and conversation[-1].get("role") != "assistant":
-        raise SystemExit(
-            "Last message is not assistant; this will fail evaluate(conversation=...)."
+    if args.input_glob:
+        convert_to_file = functools.partial(
+            _convert_to_file,
+            include_tools=not args.messages_only,
+            allow_non_assistant_last=args.allow_non_assistant_last,
+        )
+        return convert_batch(
+            convert_to_file,
+            batch_inputs(parser, args),
+            args.output_dir,
+            jobs=args.jobs,
+            status_stream=sys.stderr,
         )
+    if args.input is None:
+        parser.error("input is required unless --input-glob is given")
+
+    conversation = convert_rollout(args.input, include_tools=not args.messages_only)
+    error = _conversation_error(
+        conversation, allow_non_assistant_last=args.allow_non_assistant_last
+    )
+    if error:
+        raise SystemExit(error)
 
-    rendered = json.dumps(conversation, ensure_ascii=False, indent=2)
     if args.output:
-        args.output.write_text(rendered + "\n", encoding="utf-8")
+        _write_conversation(conversation, args.output)
         print(
             f"Wrote {len(conversation)} messages to {args.output}",
             file=sys.stderr,
         )
     else:
-        print(rendered)
+        _dump_conversation(conversation, sys.stdout)
     return 0
 
 
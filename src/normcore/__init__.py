@@ -1,14 +1,23 @@
 """
 Public API for the NormCore package.
+
+Exports are resolved lazily (PEP 562) so importing a submodule such as
+``normcore.logging`` or ``normcore.cli`` does not pull in the OpenAI SDK.
 """
 
-from .evaluator import evaluate
-from .models import (
-    AdmissibilityJudgment,
-    AdmissibilityStatus,
-    GroundRef,
-    StatementEvaluation,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .evaluator import evaluate
+    from .models import (
+        AdmissibilityJudgment,
+        AdmissibilityStatus,
+        GroundRef,
+        StatementEvaluation,
+    )
 
 __all__ = [
     "evaluate",
@@ -17,3 +26,24 @@ __all__ = [
     "GroundRef",
     "StatementEvaluation",
 ]
+
+_LAZY_EXPORTS = {
+    "evaluate": ".evaluator",
+    "AdmissibilityJudgment": ".models",
+    "AdmissibilityStatus": ".models",
+    "GroundRef": ".models",
+    "StatementEvaluation": ".models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -1,5 +1,7 @@
 """Citation subsystem for parsing and adapting evidence references."""
 
+from typing import TYPE_CHECKING, Any
+
 from .coerce import coerce_links_input
 from .grounds import (
     Ground,
@@ -7,15 +9,19 @@ from .grounds import (
     coerce_grounds_input,
     extract_citation_keys,
     grounds_from_tool_call_refs,
+    index_grounds,
     parse_grounds,
 )
 from .openai_adapter import (
-    OpenAICitation,
+    _resolve_openai_citation,
     grounds_from_openai_citations,
     link_set_from_openai_citations,
     parse_openai_citations,
 )
 
+if TYPE_CHECKING:
+    from .openai_adapter import OpenAICitation
+
 __all__ = [
     "Ground",
     "OpenAICitation",
@@ -25,7 +31,12 @@ __all__ = [
     "extract_citation_keys",
     "grounds_from_openai_citations",
     "grounds_from_tool_call_refs",
+    "index_grounds",
     "link_set_from_openai_citations",
     "parse_grounds",
     "parse_openai_citations",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    return _resolve_openai_citation(globals(), name)
@@ -3,16 +3,16 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from typing import TYPE_CHECKING
 
 from pydantic import ValidationError
 
 from ..logging import logger
 from ..models.links import LinkSet
-from .openai_adapter import (
-    OpenAICitation,
-    link_set_from_openai_citations,
-    parse_openai_citations,
-)
+from .openai_adapter import link_set_from_openai_citations, parse_openai_citations
+
+if TYPE_CHECKING:
+    from .openai_adapter import OpenAICitation
 
 
 def coerce_links_input(
@@ -33,7 +33,7 @@ def coerce_links_input(
             try:
                 return LinkSet.model_validate(links)
             except ValidationError as exc:
-                logger.warning(f"Invalid links dict ignored: {exc}")
+                logger.warning("Invalid links dict ignored: %s", exc)
                 return None
         if isinstance(links, list):
             if not links:
@@ -42,7 +42,7 @@ def coerce_links_input(
             try:
                 typed = parse_openai_citations(links)
             except ValidationError as exc:
-                logger.warning(f"Invalid links list citations ignored: {exc}")
+                logger.warning("Invalid links list citations ignored: %s", exc)
                 return None
             return link_set_from_openai_citations(typed)
         logger.warning("Unsupported links payload type ignored")
@@ -54,6 +54,6 @@ def coerce_links_input(
     try:
         typed = parse_openai_citations(openai_citations)
     except ValidationError as exc:
-        logger.warning(f"Invalid openai_citations ignored: {exc}")
+        logger.warning("Invalid openai_citations ignored: %s", exc)
         return None
     return link_set_from_openai_citations(typed)
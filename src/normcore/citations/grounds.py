@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections import defaultdict
 from collections.abc import Iterable
 from typing import Any
 
@@ -19,6 +20,9 @@ from ..models.links import (
 )
 
 _CITATION_KEY_PATTERN = re.compile(r"\[@([A-Za-z][A-Za-z0-9_-]*)\]")
+_OPENAI_CITATION_TYPES = frozenset(
+    {"file_citation", "container_file_citation", "file_path", "url_citation"}
+)
 
 
 class Ground(BaseModel):
@@ -40,39 +44,51 @@ def parse_grounds(grounds: Iterable[object] | None) -> list[Ground]:
     """Validate caller-supplied grounds payload."""
     if not grounds:
         return []
-    return _grounds_adapter.validate_python(list(grounds))
+    payload = grounds if isinstance(grounds, list) else list(grounds)
+    return _grounds_adapter.validate_python(payload)
 
 
 def extract_citation_keys(text: str) -> list[str]:
     """Extract citation keys in ``[@key]`` format preserving first-seen order."""
     if not text:
         return []
+    # Single capture group: findall yields the keys; dict.fromkeys keeps first-seen order.
+    return list(dict.fromkeys(_CITATION_KEY_PATTERN.findall(text)))
+
 
-    keys: list[str] = []
-    seen: set[str] = set()
-    for match in _CITATION_KEY_PATTERN.finditer(text):
-        key = match.group(1)
-        if key in seen:
-            continue
-        seen.add(key)
-        keys.append(key)
-    return keys
+def index_grounds(grounds: Iterable[Ground]) -> dict[str, list[Ground]]:
+    """Group grounds by citation key, preserving input order within each key."""
+    by_key: defaultdict[str, list[Ground]] = defaultdict(list)
+    for ground in grounds:
+        by_key[ground.citation_key].append(ground)
+    # Plain dict: a defaultdict would grow on lookups of uncited keys.
+    return dict(by_key)
 
 
 def build_links_from_grounds(
     *,
     text: str,
-    grounds: Iterable[Ground],
     statement_id: str,
+    grounds: Iterable[Ground] | None = None,
+    grounds_index: dict[str, list[Ground]] | None = None,
 ) -> LinkSet:
-    """Build StatementGroundLinks by resolving text citation keys against grounds."""
-    by_key: dict[str, list[Ground]] = {}
-    for ground in grounds:
-        by_key.setdefault(ground.citation_key, []).append(ground)
+    """Build StatementGroundLinks by resolving text citation keys against grounds.
+
+    Pass either ``grounds`` or a prebuilt ``grounds_index`` (see ``index_grounds``),
+    not both. Callers linking several statements against the same grounds can
+    index them once and pass the index.
+    """
+    if grounds is not None and grounds_index is not None:
+        raise ValueError("Pass either grounds or grounds_index, not both")
+    keys = extract_citation_keys(text)
+    if not keys:
+        return LinkSet(links=[])
+    by_key = grounds_index if grounds_index is not None else index_grounds(grounds or ())
 
     links: list[StatementGroundLink] = []
-    for key in extract_citation_keys(text):
-        for ground in by_key.get(key, []):
+    for key in keys:
+        default_evidence = f"citation_key={key}"
+        for ground in by_key.get(key, ()):
             links.append(
                 StatementGroundLink(
                     statement_id=statement_id,
@@ -81,7 +97,7 @@ def build_links_from_grounds(
                     provenance=Provenance(
                         creator=ground.creator,
                         evidence_type=ground.evidence_type,
-                        evidence_content=ground.evidence_content or f"citation_key={key}",
+                        evidence_content=ground.evidence_content or default_evidence,
                         signature=ground.signature,
                     ),
                 )
@@ -116,33 +132,49 @@ def coerce_grounds_input(
 ) -> list[Ground]:
     """Normalize public grounds payload with legacy compatibility."""
     normalized: list[Ground] = []
-    payload = list(grounds) if grounds else []
+    # Caller lists are validated in place (parse_* skip their copy for lists too),
+    # so a list payload is never materialized twice.
+    payload = grounds if isinstance(grounds, list) else list(grounds or ())
 
     if payload:
         try:
-            # Canonical internal shape: list[Ground].
-            normalized.extend(parse_grounds(payload))
-        except ValidationError:
-            try:
-                # Public API shape: OpenAI annotations.
-                from .openai_adapter import grounds_from_openai_citations, parse_openai_citations
-
-                typed_citations = parse_openai_citations(payload)
-                normalized.extend(grounds_from_openai_citations(typed_citations))
-            except ValidationError as exc:
-                logger.warning(f"Invalid grounds ignored: {exc}")
+            if _is_openai_citation(payload[0]):
+                # Public API shape: OpenAI annotations. Routed directly so the
+                # common case does not pay for a failed list[Ground] validation.
+                try:
+                    normalized.extend(_grounds_from_openai_payload(payload))
+                except ValidationError:
+                    # Ground ignores unknown keys, so a canonical ground may carry a type tag.
+                    normalized.extend(parse_grounds(payload))
+            else:
+                try:
+                    # Canonical internal shape: list[Ground].
+                    normalized.extend(parse_grounds(payload))
+                except ValidationError:
+                    normalized.extend(_grounds_from_openai_payload(payload))
+        except ValidationError as exc:
+            logger.warning("Invalid grounds ignored: %s", exc)
 
     if legacy_openai_citations:
         try:
-            # Local import avoids import cycle (openai_adapter imports Ground from this module).
-            from .openai_adapter import grounds_from_openai_citations, parse_openai_citations
-
-            typed_citations = parse_openai_citations(legacy_openai_citations)
-            normalized.extend(grounds_from_openai_citations(typed_citations))
+            normalized.extend(_grounds_from_openai_payload(legacy_openai_citations))
         except ValidationError as exc:
-            logger.warning(f"Invalid openai_citations ignored: {exc}")
+            logger.warning("Invalid openai_citations ignored: %s", exc)
 
     if legacy_links is not None:
         logger.warning("`links` input is deprecated and ignored; use `grounds`")
 
     return normalized
+
+
+def _is_openai_citation(item: object) -> bool:
+    """Return whether an item is tagged as an OpenAI annotation (dict or SDK model)."""
+    annotation_type = item.get("type") if isinstance(item, dict) else getattr(item, "type", None)
+    return annotation_type in _OPENAI_CITATION_TYPES
+
+
+def _grounds_from_openai_payload(citations: Iterable[Any]) -> list[Ground]:
+    # Local import avoids import cycle (openai_adapter imports Ground from this module).
+    from .openai_adapter import grounds_from_openai_citations, parse_openai_citations
+
+    return grounds_from_openai_citations(parse_openai_citations(citations))
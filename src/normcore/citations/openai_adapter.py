@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
-from openai.types.responses.response_output_text import Annotation
 from pydantic import TypeAdapter
 
 from ..models.links import (
@@ -18,13 +19,49 @@ from ..models.links import (
 )
 from .grounds import Ground
 
-OpenAICitation = Annotation
-_openai_citations_adapter = TypeAdapter(list[OpenAICitation])
+if TYPE_CHECKING:
+    from openai.types.responses.response_output_text import Annotation
+
+    OpenAICitation = Annotation
+
+# Annotation type -> attribute holding its canonical ground id.
+_GROUND_ID_FIELDS: dict[str, str] = {
+    "file_citation": "file_id",
+    "container_file_citation": "file_id",
+    "file_path": "file_id",
+    "url_citation": "url",
+}
+
+
+def _resolve_openai_citation(module_globals: dict[str, Any], name: str) -> Any:
+    """Resolve the lazy ``OpenAICitation`` export of a re-exporting module.
+
+    Every module that re-exports the alias delegates its PEP 562 ``__getattr__``
+    here, so the OpenAI SDK is only imported on first access.
+    """
+    if name != "OpenAICitation":
+        raise AttributeError(f"module {module_globals['__name__']!r} has no attribute {name!r}")
+    from openai.types.responses.response_output_text import Annotation
+
+    module_globals[name] = Annotation
+    return Annotation
+
+
+def __getattr__(name: str) -> Any:
+    return _resolve_openai_citation(globals(), name)
+
+
+@functools.lru_cache(maxsize=1)
+def _openai_citations_adapter() -> TypeAdapter[list[OpenAICitation]]:
+    from openai.types.responses.response_output_text import Annotation
+
+    return TypeAdapter(list[Annotation])
 
 
 def parse_openai_citations(citations: Iterable[object]) -> list[OpenAICitation]:
     """Validate citation payload against OpenAI SDK schema."""
-    return _openai_citations_adapter.validate_python(list(citations))
+    payload = citations if isinstance(citations, list) else list(citations)
+    return _openai_citations_adapter().validate_python(payload)
 
 
 def link_set_from_openai_citations(
@@ -81,19 +118,24 @@ def grounds_from_openai_citations(citations: Iterable[OpenAICitation]) -> list[G
 
 
 def _extract_ground_id(citation: OpenAICitation) -> str | None:
-    annotation_type = getattr(citation, "type", None)
-    if annotation_type in {"file_citation", "container_file_citation", "file_path"}:
-        file_id = getattr(citation, "file_id", None)
-        return file_id.strip() if isinstance(file_id, str) and file_id.strip() else None
-    if annotation_type == "url_citation":
-        url = getattr(citation, "url", None)
-        return url.strip() if isinstance(url, str) and url.strip() else None
-    return None
+    field = _GROUND_ID_FIELDS.get(getattr(citation, "type", ""))
+    if field is None:
+        return None
+    value = getattr(citation, field, None)
+    if not isinstance(value, str):
+        return None
+    return value.strip() or None
 
 
 def _build_evidence_content(citation: OpenAICitation, index: int) -> str:
-    payload = citation.model_dump(mode="json")
-    rendered = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    if citation.model_extra:
+        # Extra fields are dumped after the declared ones, unsorted; keep sort_keys.
+        payload = citation.model_dump(mode="json")
+        rendered = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    else:
+        # Declared SDK annotation fields are alphabetical, so pydantic-core's compact
+        # dump matches the sort_keys rendering without the dict round trip.
+        rendered = citation.model_dump_json()
     if len(rendered) > 1000:
         rendered = f"{rendered[:997]}..."
     return f"openai_citation[{index}]={rendered}"
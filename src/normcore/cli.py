@@ -5,10 +5,10 @@ Command line entry point for NormCore.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 from importlib.metadata import PackageNotFoundError, version
 
-from normcore.evaluator import evaluate
 from normcore.logging import configure_logging
 
 
@@ -26,7 +26,9 @@ def _resolve_log_level(args: argparse.Namespace) -> str | None:
     return None
 
 
+@functools.cache
 def _build_parser() -> argparse.ArgumentParser:
+    # parse_args() does not mutate the parser, so in-process callers share one instance.
     parser = argparse.ArgumentParser(
         prog="normcore",
         description="NormCore CLI.",
@@ -74,7 +76,6 @@ def _build_parser() -> argparse.ArgumentParser:
 def main(argv: list[str] | None = None) -> int:
     parser = _build_parser()
     args = parser.parse_args(argv)
-    configure_logging(level=_resolve_log_level(args))
 
     if args.version:
         try:
@@ -84,6 +85,10 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     if args.command == "evaluate":
+        # Only evaluate emits diagnostics; --version/help skip handler setup.
+        configure_logging(level=_resolve_log_level(args))
+        from normcore.evaluator import evaluate
+
         conversation = None
         if args.conversation:
             try:
@@ -106,7 +111,7 @@ def main(argv: list[str] | None = None) -> int:
             )
         except ValueError as exc:
             parser.error(str(exc))
-        print(json.dumps(judgment.model_dump(mode="json"), ensure_ascii=False, indent=2))
+        print(judgment.model_dump_json(indent=2))
         return 0
 
     parser.print_help()
@@ -51,17 +51,15 @@ The output is deterministic, auditable, and suitable for governance
 and downstream policy enforcement.
 """
 
+from __future__ import annotations
+
+import functools
 import json
-from collections.abc import Iterable
-from typing import TYPE_CHECKING, Any, cast
-
-from openai.types.chat import (
-    ChatCompletionAssistantMessageParam,
-    ChatCompletionFunctionMessageParam,
-    ChatCompletionMessageParam,
-    ChatCompletionMessageToolCallUnionParam,
-    ChatCompletionToolMessageParam,
-)
+import logging
+from collections import Counter
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, ClassVar, cast
+
 from pydantic import TypeAdapter as _TypeAdapter  # pydantic v2
 from pydantic import ValidationError
 
@@ -102,27 +100,60 @@ from .normative.models import (
     EvaluationStatus,
     KnowledgeNode,
     License,
+    Modality,
+    Statement,
     StatementValidationResult,
     ValidationResult,
 )
 from .normative.statement_extractor import StatementExtractor
 
 if TYPE_CHECKING:
+    from openai.types.chat import (
+        ChatCompletionAssistantMessageParam,
+        ChatCompletionFunctionMessageParam,
+        ChatCompletionMessageParam,
+        ChatCompletionMessageToolCallUnionParam,
+        ChatCompletionToolMessageParam,
+    )
+
     from .citations import Ground
 
 from .models import LinkSet
 
+# Status set used by _aggregate, built once instead of per call.
+_CONDITIONAL_ONLY_STATUSES = frozenset({EvaluationStatus.CONDITIONALLY_ACCEPTABLE})
 
+
+@functools.cache
 def _adapter(schema: Any) -> _TypeAdapter[Any]:
-    """Create a pydantic TypeAdapter for the given schema."""
+    """Return the process-wide pydantic TypeAdapter for the given schema."""
     return _TypeAdapter(schema)
 
 
+def _ground_ref(node: KnowledgeNode) -> GroundRef:
+    """Project an admitted knowledge node into its public grounding-trace entry."""
+    return GroundRef(
+        id=node.id,
+        scope=node.scope.value,
+        source=node.source.value,
+        status=node.status.value,
+        confidence=node.confidence,
+        strength=node.strength,
+        semantic_id=node.semantic_id,
+    )
+
+
+@functools.cache
+def _permitted_values(modalities: frozenset[Modality]) -> frozenset[str]:
+    """Project a license's permitted modalities to their public string values."""
+    return frozenset(modality.value for modality in modalities)
+
+
 def evaluate(
     *,
     agent_output: str | None = None,
     conversation: list[ChatCompletionMessageParam] | None = None,
-    grounds: list["Ground"] | None = None,
+    grounds: list[Ground] | None = None,
     **kwargs: Any,
 ) -> AdmissibilityJudgment:
     """Public evaluate contract aligned with CLI parameters."""
@@ -136,7 +167,7 @@ def evaluate(
         agent_message = trajectory[-1]
         if not isinstance(agent_message, dict) or agent_message.get("role") != "assistant":
             raise ValueError("Last conversation item must be an assistant message")
-        agent_message = cast(ChatCompletionAssistantMessageParam, agent_message)
+        agent_message = cast("ChatCompletionAssistantMessageParam", agent_message)
         if agent_output is not None:
             if not isinstance(agent_message.get("content"), str):
                 raise ValueError(
@@ -178,24 +209,52 @@ class AdmissibilityEvaluator:
     5. Aggregate results into a single admissibility judgment
     """
 
+    _shared_instance: ClassVar[AdmissibilityEvaluator | None] = None
+
     def __init__(self) -> None:
         """Initialize all components."""
+        # The OpenAI SDK is only needed once message schemas are validated; importing it
+        # here keeps `import normcore.evaluator` light for workers that never evaluate.
+        from openai.types.chat import (
+            ChatCompletionAssistantMessageParam,
+            ChatCompletionMessageParam,
+        )
+
         self.extractor = StatementExtractor()
         self.modality_detector = ModalityDetector()
         self.knowledge_builder = KnowledgeStateBuilder()
         self.ground_matcher = GroundSetMatcher()
         self.license_deriver = LicenseDeriver()
         self.axiom_checker = AxiomChecker()
-        self._message_adapter = _adapter(ChatCompletionMessageParam)
+        self._trajectory_adapter = _adapter(list[ChatCompletionMessageParam])
         self._assistant_adapter = _adapter(ChatCompletionAssistantMessageParam)
         self._content_parts_adapter = _adapter(list[_ContentPart])
+        self._role_mappers: dict[str, Callable[[Any], _MappedMessage]] = {
+            "assistant": self._map_assistant_message,
+            "tool": self._map_tool_message,
+            "function": self._map_function_message,
+        }
+
+    @classmethod
+    def _shared(cls) -> AdmissibilityEvaluator:
+        """
+        Return the process-wide instance of ``cls`` used by ``evaluate``.
+
+        Components hold no per-call state, so one instance per class is reused
+        across evaluations; subclasses get their own instance.
+        """
+        instance = cls.__dict__.get("_shared_instance")
+        if instance is None:
+            instance = cls()
+            cls._shared_instance = instance
+        return instance
 
     @classmethod
     def evaluate(
         cls,
         agent_message: ChatCompletionAssistantMessageParam,
         trajectory: list[ChatCompletionMessageParam],
-        grounds: list["Ground"] | None = None,
+        grounds: list[Ground] | None = None,
         **kwargs: Any,
     ) -> AdmissibilityJudgment:
         """
@@ -212,7 +271,7 @@ class AdmissibilityEvaluator:
         Returns:
             AdmissibilityJudgment with status and retry guidance for agent
         """
-        instance = cls()
+        instance = cls._shared()
 
         # 1. Extract tool results from trajectory
         tool_results = instance._extract_tool_results(trajectory)
@@ -246,8 +305,8 @@ class AdmissibilityEvaluator:
             grounds=combined_grounds,
             statement_id=statement_id,
         )
-        accepted_ground_ids = {ground.ground_id for ground in combined_grounds}
-        cited_ground_ids = {link.ground_id for link in links.links}
+        grounds_accepted = len({ground.ground_id for ground in combined_grounds})
+        grounds_cited = len({link.ground_id for link in links.links})
 
         if isinstance(speech_act, RefusalSpeechAct):
             internal_result = instance._evaluate_refusal(
@@ -255,8 +314,8 @@ class AdmissibilityEvaluator:
                 knowledge_nodes,
                 links,
             )
-            internal_result.grounds_accepted = len(accepted_ground_ids)
-            internal_result.grounds_cited = len(cited_ground_ids)
+            internal_result.grounds_accepted = grounds_accepted
+            internal_result.grounds_cited = grounds_cited
             return instance._to_judgment(internal_result)
         agent_output = speech_act.text
 
@@ -266,8 +325,8 @@ class AdmissibilityEvaluator:
             knowledge_nodes=knowledge_nodes,
             links=links,
         )
-        internal_result.grounds_accepted = len(accepted_ground_ids)
-        internal_result.grounds_cited = len(cited_ground_ids)
+        internal_result.grounds_accepted = grounds_accepted
+        internal_result.grounds_cited = grounds_cited
         return instance._to_judgment(internal_result)
 
     def _evaluate_core(
@@ -343,13 +402,13 @@ class AdmissibilityEvaluator:
                 explanation="Protocol-only output (greetings/offers) - no normative claims to evaluate",
             )
 
-        logger.info(f"AdmissibilityEvaluator: Extracted {len(statements)} statements")
+        logger.info("AdmissibilityEvaluator: Extracted %d statements", len(statements))
 
         # 2. Validate each statement
         statement_results = []
         axiom_results = []
-
-        from .normative.models import Modality
+        # Per-statement trace is only built when INFO is enabled (checked once per call).
+        log_statements = logger.isEnabledFor(logging.INFO)
 
         for statement in statements:
             # Detect modality and extract conditions
@@ -392,17 +451,19 @@ class AdmissibilityEvaluator:
             statement_results.append(stmt_result)
 
             # Log evaluation
-            logger.info(f"  Statement: {statement.raw_text[:80]}...")
-            modality_label = (
-                statement.modality.value if statement.modality is not None else "unknown"
-            )
-            logger.info(
-                f"    Modality: {modality_label}, "
-                f"License: {[m.value for m in license.permitted_modalities]}, "
-                f"Status: {result.status.value}"
-            )
-            if result.violated_axiom:
-                logger.info(f"    Violated: {result.violated_axiom}")
+            if log_statements:
+                logger.info("  Statement: %.80s...", statement.raw_text)
+                modality_label = (
+                    statement.modality.value if statement.modality is not None else "unknown"
+                )
+                logger.info(
+                    "    Modality: %s, License: %s, Status: %s",
+                    modality_label,
+                    [m.value for m in license.permitted_modalities],
+                    result.status.value,
+                )
+                if result.violated_axiom:
+                    logger.info("    Violated: %s", result.violated_axiom)
 
         # 3. Aggregate to ValidationResult (lexicographic logic)
         return self._aggregate(
@@ -438,9 +499,11 @@ class AdmissibilityEvaluator:
         Returns ValidationResult with status, feedback_hint, violations.
         """
         violations = [r.violated_axiom for r in axiom_results if r.violated_axiom]
+        # One pass over statuses; the cascade below only does membership checks.
+        status_counts = Counter(r.status for r in axiom_results)
 
         # Lexicographic aggregation
-        if any(r.status == EvaluationStatus.VIOLATES_NORM for r in axiom_results):
+        if EvaluationStatus.VIOLATES_NORM in status_counts:
             status = EvaluationStatus.VIOLATES_NORM
             licensed = False
             can_retry = True
@@ -450,7 +513,7 @@ class AdmissibilityEvaluator:
             )
             explanation = f"Violated axioms: {violations}"
 
-        elif any(r.status == EvaluationStatus.ILL_FORMED for r in axiom_results):
+        elif EvaluationStatus.ILL_FORMED in status_counts:
             status = EvaluationStatus.ILL_FORMED
             licensed = False
             can_retry = True
@@ -460,14 +523,14 @@ class AdmissibilityEvaluator:
             )
             explanation = "Structurally ill-formed statements detected"
 
-        elif any(r.status == EvaluationStatus.UNDERDETERMINED for r in axiom_results):
+        elif EvaluationStatus.UNDERDETERMINED in status_counts:
             status = EvaluationStatus.UNDERDETERMINED
             licensed = False
             can_retry = False
             feedback_hint = None  # Validator has no jurisdiction
             explanation = "Validator has no jurisdiction to judge"
 
-        elif any(r.status == EvaluationStatus.UNSUPPORTED for r in axiom_results):
+        elif EvaluationStatus.UNSUPPORTED in status_counts:
             status = EvaluationStatus.UNSUPPORTED
             licensed = True
             can_retry = True
@@ -477,14 +540,14 @@ class AdmissibilityEvaluator:
             )
             explanation = "Statements lack required grounding (A4)"
 
-        elif all(r.status == EvaluationStatus.CONDITIONALLY_ACCEPTABLE for r in axiom_results):
+        elif status_counts.keys() <= _CONDITIONAL_ONLY_STATUSES:
             status = EvaluationStatus.CONDITIONALLY_ACCEPTABLE
             licensed = True
             can_retry = False
             feedback_hint = None
             explanation = "All statements are conditionally acceptable"
 
-        elif any(r.status == EvaluationStatus.CONDITIONALLY_ACCEPTABLE for r in axiom_results):
+        elif EvaluationStatus.CONDITIONALLY_ACCEPTABLE in status_counts:
             status = EvaluationStatus.CONDITIONALLY_ACCEPTABLE
             licensed = True
             can_retry = False
@@ -499,15 +562,18 @@ class AdmissibilityEvaluator:
             feedback_hint = None
             explanation = "All statements are normatively acceptable"
 
-        num_acceptable = sum(
-            1
-            for r in axiom_results
-            if r.status in {EvaluationStatus.ACCEPTABLE, EvaluationStatus.CONDITIONALLY_ACCEPTABLE}
+        num_acceptable = (
+            status_counts[EvaluationStatus.ACCEPTABLE]
+            + status_counts[EvaluationStatus.CONDITIONALLY_ACCEPTABLE]
         )
 
         logger.info(
-            f"AdmissibilityEvaluator: Status={status.value}, Licensed={licensed}, "
-            f"({num_acceptable}/{len(statement_results)} acceptable, {len(violations)} violations)"
+            "AdmissibilityEvaluator: Status=%s, Licensed=%s, (%d/%d acceptable, %d violations)",
+            status.value,
+            licensed,
+            num_acceptable,
+            len(statement_results),
+            len(violations),
         )
 
         return ValidationResult(
@@ -541,27 +607,16 @@ class AdmissibilityEvaluator:
 
         for stmt in result.statement_results:
             modality = stmt.statement.modality.value if stmt.statement.modality else "unknown"
-            permitted = {m.value for m in stmt.license.permitted_modalities}
-
-            grounding_trace = [
-                GroundRef(
-                    id=k.id,
-                    scope=k.scope.value,
-                    source=k.source.value,
-                    status=k.status.value,
-                    confidence=k.confidence,
-                    strength=k.strength,
-                    semantic_id=k.semantic_id,
-                )
-                for k in stmt.ground_set.nodes
-            ]
+            permitted = _permitted_values(frozenset(stmt.license.permitted_modalities))
+
+            grounding_trace = [_ground_ref(k) for k in stmt.ground_set.nodes]
 
             statement_evaluations.append(
                 StatementEvaluation(
                     statement_id=stmt.statement.id,
                     statement=stmt.statement.raw_text,
                     modality=modality,
-                    license=permitted,
+                    license=set(permitted),
                     status=_status(stmt.status),
                     violated_axiom=stmt.violated_axiom,
                     explanation=stmt.explanation,
@@ -606,24 +661,25 @@ class AdmissibilityEvaluator:
         """
         tool_results = []
 
-        tool_call_by_id: dict[str, dict] = {}
-        for message in trajectory:
-            validated_message = self._validate_message(message)
-            mapped_message = self._map_message(validated_message)
-            if not isinstance(mapped_message, _AssistantMessage):
-                continue
-            for tool_call in mapped_message.tool_calls:
-                if isinstance(tool_call, _FunctionToolCall):
-                    args = self._parse_tool_args(tool_call.arguments)
-                    tool_call_by_id[tool_call.id] = {
-                        "name": tool_call.name,
-                        "arguments": args,
-                    }
+        # Single validation/mapping pass. Tool/function messages are resolved
+        # afterwards, once every assistant tool call is known.
+        mapped_messages = [
+            self._map_message(validated_message)
+            for validated_message in self._validate_trajectory(trajectory)
+        ]
+        tool_call_by_id: dict[str, dict] = {
+            tool_call.id: {
+                "name": tool_call.name,
+                "arguments": self._parse_tool_args(tool_call.arguments),
+            }
+            for mapped_message in mapped_messages
+            if isinstance(mapped_message, _AssistantMessage)
+            for tool_call in mapped_message.tool_calls
+            if isinstance(tool_call, _FunctionToolCall)
+        }
 
         # Method 2: Extract from separate tool messages (role='tool')
-        for message in trajectory:
-            validated_message = self._validate_message(message)
-            mapped_message = self._map_message(validated_message)
+        for mapped_message in mapped_messages:
             if isinstance(mapped_message, _ToolMessage):
                 call_meta = tool_call_by_id.get(mapped_message.tool_call_id, {})
                 content = self._extract_text_content(mapped_message.content)
@@ -648,14 +704,14 @@ class AdmissibilityEvaluator:
         return tool_results
 
     @staticmethod
-    def _extract_text_content(content: str | list["_ContentPart"] | None) -> str:
+    def _extract_text_content(content: str | list[_ContentPart] | None) -> str:
         """Normalize message content into a plain text string."""
         if content is None:
             return ""
         if isinstance(content, str):
             return content
         if isinstance(content, list):
-            return "".join(p.text for p in content if isinstance(p, _TextPart)).strip()
+            return "".join([p.text for p in content if isinstance(p, _TextPart)]).strip()
         raise ValueError(f"Unsupported content type: {type(content)}")
 
     @staticmethod
@@ -673,27 +729,29 @@ class AdmissibilityEvaluator:
                 return {}
         return {}
 
-    def _validate_message(self, message: ChatCompletionMessageParam) -> ChatCompletionMessageParam:
-        """Validate a raw message against the OpenAI message schema."""
+    def _validate_trajectory(
+        self, trajectory: list[ChatCompletionMessageParam]
+    ) -> list[ChatCompletionMessageParam]:
+        """Validate raw messages against the OpenAI message schema in one adapter call."""
         try:
-            return cast(ChatCompletionMessageParam, self._message_adapter.validate_python(message))
+            return cast(
+                "list[ChatCompletionMessageParam]",
+                self._trajectory_adapter.validate_python(trajectory),
+            )
         except ValidationError as exc:  # pragma: no cover
             raise ValueError(f"Invalid OpenAI ChatCompletionMessageParam: {exc}") from exc
 
-    def _map_message(self, message: ChatCompletionMessageParam) -> "_MappedMessage":
+    def _map_message(self, message: ChatCompletionMessageParam) -> _MappedMessage:
         """Map a validated message into an internal message model."""
         role = message["role"]
-        if role == "assistant":
-            return self._map_assistant_message(cast(ChatCompletionAssistantMessageParam, message))
-        if role == "tool":
-            return self._map_tool_message(cast(ChatCompletionToolMessageParam, message))
-        if role == "function":
-            return self._map_function_message(cast(ChatCompletionFunctionMessageParam, message))
-        return _OtherMessage(role=role)
+        mapper = self._role_mappers.get(role)
+        if mapper is None:
+            return _OtherMessage(role=role)
+        return mapper(message)
 
     def _map_assistant_message(
         self, message: ChatCompletionAssistantMessageParam
-    ) -> "_AssistantMessage":
+    ) -> _AssistantMessage:
         """Convert assistant message into internal assistant model."""
         content = self._map_content(message.get("content", None))
         tool_calls = []
@@ -701,7 +759,7 @@ class AdmissibilityEvaluator:
             tool_calls.append(self._map_tool_call(tool_call))
         return _AssistantMessage(content=content, tool_calls=tool_calls)
 
-    def _map_tool_message(self, message: ChatCompletionToolMessageParam) -> "_ToolMessage":
+    def _map_tool_message(self, message: ChatCompletionToolMessageParam) -> _ToolMessage:
         """Convert tool message into internal tool model."""
         content = self._map_content(message["content"])
         if any(isinstance(p, _RefusalPart) for p in (content or [])):
@@ -710,22 +768,24 @@ class AdmissibilityEvaluator:
 
     def _map_function_message(
         self, message: ChatCompletionFunctionMessageParam
-    ) -> "_FunctionMessage":
+    ) -> _FunctionMessage:
         """Convert function message into internal function model."""
         content = self._map_content(message["content"])
         return _FunctionMessage(name=message["name"], content=content)
 
-    def _map_content(self, content: Any) -> str | list["_ContentPart"] | None:
+    def _map_content(self, content: Any) -> str | list[_ContentPart] | None:
         """Validate and normalize message content into internal parts."""
         if content is None:
             return None
         if isinstance(content, str):
             return content
+        # Validated messages hand content over as pydantic's lazy ValidatorIterator,
+        # so a list/tuple fast path would never be taken.
         if isinstance(content, Iterable):
             return cast(list[_ContentPart], self._content_parts_adapter.validate_python(content))
         raise ValueError(f"Unsupported content type: {type(content)}")
 
-    def _map_tool_call(self, tool_call: ChatCompletionMessageToolCallUnionParam) -> "_ToolCall":
+    def _map_tool_call(self, tool_call: ChatCompletionMessageToolCallUnionParam) -> _ToolCall:
         """Convert a tool call into its internal representation."""
         if tool_call["type"] == "function":
             fn = tool_call["function"]
@@ -748,15 +808,21 @@ class AdmissibilityEvaluator:
     ) -> TextSpeechAct | RefusalSpeechAct:
         """Convert assistant message content into a text or refusal speech act."""
         content = assistant_message.content
-        if content is None:
-            return TextSpeechAct(text="")
+        # Plain string content is by far the most common shape; check it first.
         if isinstance(content, str):
             return TextSpeechAct(text=content)
+        if content is None:
+            return TextSpeechAct(text="")
         if isinstance(content, list):
-            refusal_parts = [p.refusal for p in content if isinstance(p, _RefusalPart)]
-            text_parts = [p.text for p in content if isinstance(p, _TextPart)]
-            if refusal_parts and text_parts:
-                raise ValueError("Assistant content cannot mix text and refusal parts")
+            refusal_parts: list[str] = []
+            text_parts: list[str] = []
+            for part in content:
+                if isinstance(part, _TextPart):
+                    text_parts.append(part.text)
+                elif isinstance(part, _RefusalPart):
+                    refusal_parts.append(part.refusal)
+                if refusal_parts and text_parts:
+                    raise ValueError("Assistant content cannot mix text and refusal parts")
             if refusal_parts:
                 return RefusalSpeechAct(refusal="".join(refusal_parts).strip())
             return TextSpeechAct(text="".join(text_parts).strip())
@@ -769,8 +835,6 @@ class AdmissibilityEvaluator:
         links: LinkSet | None,
     ) -> ValidationResult:
         """Evaluate a refusal speech act using the same axioms."""
-        from .normative.models import Modality, Statement
-
         statement = Statement(
             id="refusal",
             subject="agent",
@@ -12,7 +12,10 @@ import os
 
 LOGGER_NAME = "normcore"
 logger = logging.getLogger(LOGGER_NAME)
-logger.addHandler(logging.NullHandler())
+# Shared across resets; neither object holds per-call state.
+_NULL_HANDLER = logging.NullHandler()
+_FORMATTER = logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+logger.addHandler(_NULL_HANDLER)
 
 
 def configure_logging(level: str | None = None) -> None:
@@ -24,18 +27,18 @@ def configure_logging(level: str | None = None) -> None:
     env_level = os.getenv("NORMCORE_LOG_LEVEL", "")
     raw_level = level if level is not None else (env_level or "")
     resolved_level = raw_level.strip()
-    pkg_logger = logging.getLogger(LOGGER_NAME)
+    pkg_logger = logger
     # Always reset handlers to avoid stale stderr streams across repeated CLI calls.
     pkg_logger.handlers = []
 
     if not resolved_level:
-        pkg_logger.addHandler(logging.NullHandler())
+        pkg_logger.addHandler(_NULL_HANDLER)
         pkg_logger.setLevel(logging.NOTSET)
         pkg_logger.propagate = False
         return
 
     handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s"))
+    handler.setFormatter(_FORMATTER)
     pkg_logger.addHandler(handler)
     pkg_logger.setLevel(getattr(logging, resolved_level.upper(), logging.INFO))
     pkg_logger.propagate = False
@@ -1,3 +1,6 @@
+from typing import TYPE_CHECKING, Any
+
+from ..citations.openai_adapter import _resolve_openai_citation
 from .evaluator import (
     AdmissibilityJudgment,
     AdmissibilityStatus,
@@ -20,11 +23,13 @@ from .messages import (
     ToolResultSpeechAct,
 )
 from .openai_citations import (
-    OpenAICitation,
     link_set_from_openai_citations,
     parse_openai_citations,
 )
 
+if TYPE_CHECKING:
+    from .openai_citations import OpenAICitation
+
 __all__ = [
     "AdmissibilityJudgment",
     "AdmissibilityStatus",
@@ -45,3 +50,7 @@ __all__ = [
     "link_set_from_openai_citations",
     "parse_openai_citations",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    return _resolve_openai_citation(globals(), name)
@@ -4,7 +4,8 @@ Internal OpenAI-mapped message models and speech acts.
 
 from __future__ import annotations
 
-from typing import Literal
+from dataclasses import dataclass, field
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, Field
 
@@ -45,16 +46,23 @@ class _RefusalPart(BaseModel):
     }
 
 
-_ContentPart = _TextPart | _RefusalPart
+# Tagged on ``type`` so pydantic-core dispatches each part directly instead of
+# trying every member of the union.
+_ContentPart = Annotated[_TextPart | _RefusalPart, Field(discriminator="type")]
 
+# The models below wrap already-validated OpenAI params, so they are plain slotted
+# dataclasses rather than pydantic models.
 
-class _FunctionToolCall(BaseModel):
+
+@dataclass(slots=True)
+class _FunctionToolCall:
     id: str
     name: str
     arguments: str
 
 
-class _CustomToolCall(BaseModel):
+@dataclass(slots=True)
+class _CustomToolCall:
     id: str
     name: str
     input_value: str
@@ -63,22 +71,26 @@ class _CustomToolCall(BaseModel):
 _ToolCall = _FunctionToolCall | _CustomToolCall
 
 
-class _AssistantMessage(BaseModel):
+@dataclass(slots=True)
+class _AssistantMessage:
     content: str | list[_ContentPart] | None
-    tool_calls: list[_ToolCall] = Field(default_factory=list)
+    tool_calls: list[_ToolCall] = field(default_factory=list)
 
 
-class _ToolMessage(BaseModel):
+@dataclass(slots=True)
+class _ToolMessage:
     tool_call_id: str
     content: str | list[_ContentPart] | None
 
 
-class _FunctionMessage(BaseModel):
+@dataclass(slots=True)
+class _FunctionMessage:
     name: str
     content: str | list[_ContentPart] | None
 
 
-class _OtherMessage(BaseModel):
+@dataclass(slots=True)
+class _OtherMessage:
     role: str
 
 
@@ -3,14 +3,23 @@
 New code should import from ``normcore.citations``.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from ..citations.openai_adapter import (
-    OpenAICitation,
+    _resolve_openai_citation,
     link_set_from_openai_citations,
     parse_openai_citations,
 )
 
+if TYPE_CHECKING:
+    from ..citations.openai_adapter import OpenAICitation
+
 __all__ = [
     "OpenAICitation",
     "link_set_from_openai_citations",
     "parse_openai_citations",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    return _resolve_openai_citation(globals(), name)
@@ -123,8 +123,11 @@ class GroundSetMatcher:
                 relevant.append(k)
 
         logger.debug(
-            f"GroundSetMatcher: Found {len(relevant)}/{len(knowledge_nodes)} relevant nodes "
-            f"for statement '{statement.subject} {statement.predicate}'"
+            "GroundSetMatcher: Found %d/%d relevant nodes for statement '%s %s'",
+            len(relevant),
+            len(knowledge_nodes),
+            statement.subject,
+            statement.predicate,
         )
 
         return GroundSet(nodes=relevant)
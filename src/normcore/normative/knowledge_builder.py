@@ -22,8 +22,10 @@ This builder:
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import re
 from typing import TYPE_CHECKING
 
 from ..logging import logger
@@ -33,6 +35,11 @@ from .models import KnowledgeNode, Scope, Source, Status
 if TYPE_CHECKING:
     from ..citations import Ground
 
+_KEY_FIELD_PATTERN = re.compile(r"^(\w+)_key$")
+_ID_FIELD_PATTERN = re.compile(r"^(\w+)_id$")
+# Tool outputs longer than this skip the memo so the cache never pins large payloads.
+_MAX_CACHED_CONTENT_LENGTH = 4096
+
 
 class KnowledgeStateBuilder:
     """
@@ -66,7 +73,9 @@ class KnowledgeStateBuilder:
                 if refs:
                     tool_call_refs[result.tool_call_id] = refs
 
-        logger.debug(f"KnowledgeStateBuilder: Built {len(nodes)} knowledge nodes from tool results")
+        logger.debug(
+            "KnowledgeStateBuilder: Built %d knowledge nodes from tool results", len(nodes)
+        )
         return nodes, tool_call_refs
 
     def materialize_external_grounds(
@@ -112,7 +121,7 @@ class KnowledgeStateBuilder:
         """
         tool_name = tool_result.tool_name or "unknown"
         if self._is_non_epistemic_tool(tool_name):
-            logger.debug(f"Filtering non-epistemic tool result from GroundSet: {tool_name}")
+            logger.debug("Filtering non-epistemic tool result from GroundSet: %s", tool_name)
             return None
 
         # NEW v0.3.1: Extract semantic_id(s) for LinkSet integration.
@@ -205,25 +214,11 @@ class KnowledgeStateBuilder:
         if not content:
             return None
 
-        try:
-            data = json.loads(content) if isinstance(content, str) else content
-
-            if isinstance(data, list):
-                semantic_ids: list[str] = []
-                for item in data:
-                    if isinstance(item, dict):
-                        entity_id = self._extract_entity_id(item)
-                        if entity_id:
-                            semantic_ids.append(entity_id)
-                return semantic_ids if semantic_ids else None
-
-            if isinstance(data, dict):
-                return self._extract_entity_id(data)
-
-            return None
-
-        except (json.JSONDecodeError, TypeError, AttributeError):
-            return None
+        if isinstance(content, str):
+            semantic_ids = _semantic_ids_from_json(content)
+        else:
+            semantic_ids = _semantic_ids_from_data(content)
+        return list(semantic_ids) if isinstance(semantic_ids, tuple) else semantic_ids
 
     @staticmethod
     def _extract_entity_id(data: dict) -> str | None:
@@ -234,22 +229,19 @@ class KnowledgeStateBuilder:
         1. *_key fields
         2. *_id fields
         """
-        import re
-
-        key_pattern = re.compile(r"^(\w+)_key$")
-        id_pattern = re.compile(r"^(\w+)_id$")
-
-        for field_name, value in data.items():
-            match = key_pattern.match(field_name)
-            if match and value:
-                return f"{match.group(1)}_{value}"
-
+        id_entity: str | None = None
         for field_name, value in data.items():
-            match = id_pattern.match(field_name)
-            if match and value:
+            if not value:
+                continue
+            match = _KEY_FIELD_PATTERN.match(field_name)
+            if match:
                 return f"{match.group(1)}_{value}"
+            if id_entity is None:
+                match = _ID_FIELD_PATTERN.match(field_name)
+                if match:
+                    id_entity = f"{match.group(1)}_{value}"
 
-        return None
+        return id_entity
 
     @staticmethod
     def _stable_id_fragment(value: str) -> str:
@@ -261,3 +253,55 @@ class KnowledgeStateBuilder:
         """
         digest = hashlib.sha256(value.encode("utf-8")).hexdigest()
         return digest[:10]
+
+
+def _semantic_ids_from_data(data: object) -> str | tuple[str, ...] | None:
+    """Extract semantic ID(s) from decoded tool result data."""
+    # Array results (search_issues, search_transactions, etc.)
+    if isinstance(data, list):
+        semantic_ids: list[str] = []
+        for item in data:
+            if isinstance(item, dict):
+                entity_id = KnowledgeStateBuilder._extract_entity_id(item)
+                if entity_id:
+                    semantic_ids.append(entity_id)
+        return tuple(semantic_ids) if semantic_ids else None
+
+    if isinstance(data, dict):
+        return KnowledgeStateBuilder._extract_entity_id(data)
+
+    return None
+
+
+def _semantic_ids_from_json(content: str) -> str | tuple[str, ...] | None:
+    """
+    Decode a JSON tool result and extract semantic ID(s).
+
+    Memoized per distinct content up to ``_MAX_CACHED_CONTENT_LENGTH`` characters:
+    the same tool outputs are re-evaluated whenever a growing trajectory is
+    judged turn by turn. Larger outputs are decoded directly. Only the immutable
+    extraction result is cached, never the decoded JSON.
+    """
+    if len(content) > _MAX_CACHED_CONTENT_LENGTH:
+        return _decode_semantic_ids(content)
+    return _cached_semantic_ids(content)
+
+
+def _decode_semantic_ids(content: str) -> str | tuple[str, ...] | None:
+    """Decode ``content`` and extract semantic ID(s).
+
+    ``content`` is ``ToolResultSpeechAct.result_text``, which is always ``str``,
+    so ``json.loads`` can only fail with ``JSONDecodeError``.
+    """
+    # Only arrays and objects can carry entity ids; plain-text and scalar
+    # results are rejected without running the decoder.
+    if content.lstrip()[:1] not in ("{", "["):
+        return None
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        return None
+    return _semantic_ids_from_data(data)
+
+
+_cached_semantic_ids = functools.lru_cache(maxsize=256)(_decode_semantic_ids)
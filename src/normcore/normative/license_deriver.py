@@ -50,6 +50,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from ..logging import logger
+from ..models.links import LinkRole
 from .models import GroundSet, License, Modality, Scope
 
 if TYPE_CHECKING:
@@ -82,25 +83,29 @@ class LicenseDeriver:
         return License(permitted_modalities={Modality.CONDITIONAL, Modality.REFUSAL})
 
     def _derive_with_links(self, ground_set: GroundSet, links: LinkSet) -> License:
-        from ..models import LinkRole
-
-        support_links = [link for link in links.links if link.role == LinkRole.SUPPORTS]
-        if not support_links:
+        support_ground_ids = [
+            link.ground_id for link in links.links if link.role == LinkRole.SUPPORTS
+        ]
+        if not support_ground_ids:
             logger.debug("License (with links): REFUSAL only (no SUPPORTS links)")
             return License(permitted_modalities={Modality.REFUSAL})
 
+        # One index per derivation instead of a linear resolve_ground() scan per link.
+        ground_index = ground_set.ground_index()
         used_grounds = []
         unresolved = []
-        for link in support_links:
-            ground = ground_set.resolve_ground(link.ground_id)
+        for ground_id in support_ground_ids:
+            ground = ground_index.get(ground_id)
             if ground is None:
-                unresolved.append(link.ground_id)
+                unresolved.append(ground_id)
             else:
                 used_grounds.append(ground)
 
         if unresolved:
             logger.warning(
-                f"License (with links): Could not resolve {len(unresolved)} grounds: {unresolved[:3]}..."
+                "License (with links): Could not resolve %d grounds: %s...",
+                len(unresolved),
+                unresolved[:3],
             )
 
         if not used_grounds:
@@ -149,8 +154,6 @@ class LicenseDeriver:
 
         if links is not None:
             try:
-                from ..models import LinkRole
-
                 support_links = [link for link in links.links if link.role == LinkRole.SUPPORTS]
                 trace["supports_links_count"] = len(support_links)
             except Exception:  # pragma: no cover
@@ -65,12 +65,19 @@ LIMITATIONS
 - No semantic inference by design
 """
 
+import functools
 import re
 
 from ..logging import logger
 from .models import Modality, Statement
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_indicators(indicators: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    """Compile a set of formal indicators once; detectors are built per evaluator."""
+    return tuple(re.compile(indicator, re.IGNORECASE) for indicator in indicators)
+
+
 class ModalityDetector:
     """
     Determine statement modality from formal indicators.
@@ -201,27 +208,18 @@ class ModalityDetector:
     ]
 
     def __init__(self) -> None:
-        """Initialize detector with compiled formal indicators."""
-        self._refusal_re = [re.compile(ind, re.IGNORECASE) for ind in self.REFUSAL_FORM_INDICATORS]
-        self._conditional_re = [
-            re.compile(ind, re.IGNORECASE) for ind in self.CONDITIONAL_FORM_INDICATORS
-        ]
-        self._goal_conditional_re = [
-            re.compile(ind, re.IGNORECASE) for ind in self.GOAL_CONDITIONAL_FORM_INDICATORS
-        ]
-        self._personalization_conditional_re = [
-            re.compile(ind, re.IGNORECASE)
-            for ind in self.PERSONALIZATION_CONDITIONAL_FORM_INDICATORS
-        ]
-        self._descriptive_re = [
-            re.compile(ind, re.IGNORECASE) for ind in self.DESCRIPTIVE_FORM_INDICATORS
-        ]
-        self._normative_re = [
-            re.compile(ind, re.IGNORECASE) for ind in self.NORMATIVE_FORM_INDICATORS
-        ]
-        self._recommendation_re = [
-            re.compile(ind, re.IGNORECASE) for ind in self.RECOMMENDATION_FORM_INDICATORS
-        ]
+        """Initialize detector with compiled formal indicators (shared per process)."""
+        self._refusal_re = _compile_indicators(tuple(self.REFUSAL_FORM_INDICATORS))
+        self._conditional_re = _compile_indicators(tuple(self.CONDITIONAL_FORM_INDICATORS))
+        self._goal_conditional_re = _compile_indicators(
+            tuple(self.GOAL_CONDITIONAL_FORM_INDICATORS)
+        )
+        self._personalization_conditional_re = _compile_indicators(
+            tuple(self.PERSONALIZATION_CONDITIONAL_FORM_INDICATORS)
+        )
+        self._descriptive_re = _compile_indicators(tuple(self.DESCRIPTIVE_FORM_INDICATORS))
+        self._normative_re = _compile_indicators(tuple(self.NORMATIVE_FORM_INDICATORS))
+        self._recommendation_re = _compile_indicators(tuple(self.RECOMMENDATION_FORM_INDICATORS))
 
     def detect(self, text: str) -> Modality:
         """
@@ -274,7 +272,7 @@ class ModalityDetector:
 
         # 1. Check REFUSAL (highest priority)
         if self._is_refusal(core):
-            logger.debug(f"Modality: REFUSAL for: {text[:60]}...")
+            logger.debug("Modality: REFUSAL for: %.60s...", text)
             return Modality.REFUSAL
 
         # 2. Check GOAL-CONDITIONAL (BEFORE recommendation override)
@@ -290,7 +288,7 @@ class ModalityDetector:
         # Goal-conditional = recommendation conditioned on user's objectives
         # This is NOT the same as "X is better. If you tell me..."
         if self._is_goal_conditional(core):
-            logger.debug(f"Modality: CONDITIONAL (goal-conditional) for: {text[:60]}...")
+            logger.debug("Modality: CONDITIONAL (goal-conditional) for: %.60s...", text)
             return Modality.CONDITIONAL
 
         # 2.5. Check PERSONALIZATION framing (BEFORE recommendation override)
@@ -298,32 +296,32 @@ class ModalityDetector:
         # Policy: personalization framing upgrades otherwise-descriptive utterances into
         # normative participation (CONDITIONAL), because the claim is context-relative.
         if self._is_personalization_conditional(core):
-            logger.debug(f"Modality: CONDITIONAL (personalization framing) for: {text[:60]}...")
+            logger.debug("Modality: CONDITIONAL (personalization framing) for: %.60s...", text)
             return Modality.CONDITIONAL
 
         # 3. Check ASSERTIVE with recommendation (BEFORE general conditional)
         # If core contains recommendation markers → ASSERTIVE
         # Even if conditional markers also present in full text
         if self._has_recommendation(core):
-            logger.debug(f"Modality: ASSERTIVE (recommendation in core) for: {text[:60]}...")
+            logger.debug("Modality: ASSERTIVE (recommendation in core) for: %.60s...", text)
             return Modality.ASSERTIVE
 
         # 4. Check CONDITIONAL (only if CORE is conditional)
         # This is the key fix: conditional markers in tail don't count
         if self._is_conditional(core):
-            logger.debug(f"Modality: CONDITIONAL for: {text[:60]}...")
+            logger.debug("Modality: CONDITIONAL for: %.60s...", text)
             return Modality.CONDITIONAL
 
         # 5. Check DESCRIPTIVE (factual, no normative claim)
         if self._is_descriptive(core) and not self._is_normative(core):
-            logger.debug(f"Modality: DESCRIPTIVE for: {text[:60]}...")
+            logger.debug("Modality: DESCRIPTIVE for: %.60s...", text)
             return Modality.DESCRIPTIVE
 
         # 6. Default: ASSERTIVE (anti-evasion POLICY)
         # CRITICAL v0.2: This is POLICY choice, not logical necessity
         # See module docstring §3 for full explanation
         # v0.3 may make this configurable (ModalityPolicy parameter)
-        logger.debug(f"Modality: ASSERTIVE (default policy) for: {text[:60]}...")
+        logger.debug("Modality: ASSERTIVE (default policy) for: %.60s...", text)
         return Modality.ASSERTIVE
 
     def detect_with_conditions(self, statement: Statement) -> Statement:
@@ -450,7 +448,7 @@ class ModalityDetector:
         # Strategy 1: Double newline (paragraph break)
         if "\n\n" in text:
             core = text.split("\n\n")[0].strip()
-            logger.debug(f"Core (paragraph): {core[:80]}...")
+            logger.debug("Core (paragraph): %.80s...", core)
             return core
 
         # Strategy 2: First sentence (period + space or newline)
@@ -460,18 +458,18 @@ class ModalityDetector:
         sentence_match = re.search(r"^(.+?\.)\s", text, re.DOTALL)
         if sentence_match:
             core = sentence_match.group(1).strip()
-            logger.debug(f"Core (sentence): {core[:80]}...")
+            logger.debug("Core (sentence): %.80s...", core)
             return core
 
         # Strategy 3: First line (if multiline without period)
         if "\n" in text:
             core = text.split("\n")[0].strip()
-            logger.debug(f"Core (first line): {core[:80]}...")
+            logger.debug("Core (first line): %.80s...", core)
             return core
 
         # Strategy 4: Fallback - first 500 chars
         core = text[:500].strip()
-        logger.debug(f"Core (fallback 500): {core[:80]}...")
+        logger.debug("Core (fallback 500): %.80s...", core)
         return core
 
     def _extract_conditions(self, text: str) -> list[str]:
@@ -316,6 +316,21 @@ class GroundSet:
 
         return None
 
+    def ground_index(self) -> dict[str, KnowledgeNode]:
+        """
+        Build a ground-id lookup with the same precedence as resolve_ground().
+
+        Canonical ids win over semantic ids, and the first node wins within
+        each kind. Use it when resolving many ids against one GroundSet.
+        """
+        index: dict[str, KnowledgeNode] = {}
+        for node in reversed(self.nodes):
+            if node.semantic_id:
+                index[node.semantic_id] = node
+        for node in reversed(self.nodes):
+            index[node.id] = node
+        return index
+
 
 @dataclass
 class License:
@@ -345,7 +360,7 @@ class AxiomCheckResult:
     explanation: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class StatementValidationResult:
     """
     Validation result for a single statement.
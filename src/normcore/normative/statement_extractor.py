@@ -274,8 +274,9 @@ class StatementExtractor:
         )
 
         logger.debug(
-            f"StatementExtractor: Extracted single statement "
-            f"(length={len(cleaned_text)} chars, preview: {cleaned_text[:80]}...)"
+            "StatementExtractor: Extracted single statement (length=%d chars, preview: %.80s...)",
+            len(cleaned_text),
+            cleaned_text,
         )
 
         return [statement]
@@ -548,8 +549,10 @@ class StatementExtractor:
         # Log if anything was stripped
         if len(cleaned) < original_length:
             logger.debug(
-                f"StatementExtractor: Stripped protocol speech "
-                f"(original: {original_length} chars, cleaned: {len(cleaned)} chars)"
+                "StatementExtractor: Stripped protocol speech "
+                "(original: %d chars, cleaned: %d chars)",
+                original_length,
+                len(cleaned),
             )
 
         return cleaned
@@ -1,10 +1,14 @@
+import pytest
+
 from normcore.citations.grounds import (
     Ground,
     build_links_from_grounds,
     extract_citation_keys,
     grounds_from_tool_call_refs,
+    index_grounds,
     parse_grounds,
 )
+from normcore.models.links import LinkSet
 
 
 def test_extract_citation_keys_preserves_order_and_uniqueness():
@@ -33,6 +37,48 @@ def test_build_links_from_grounds_only_for_cited_keys():
     assert link_set.links[0].statement_id == "final_response"
 
 
+def test_build_links_from_grounds_reuses_prebuilt_index():
+    grounds = [
+        Ground(citation_key="DocX", ground_id="file_1"),
+        Ground(citation_key="DocX", ground_id="file_2"),
+        Ground(citation_key="DocY", ground_id="file_3"),
+    ]
+    grounds_index = index_grounds(grounds)
+
+    first = build_links_from_grounds(
+        text="See [@DocX].", statement_id="s1", grounds_index=grounds_index
+    )
+    second = build_links_from_grounds(
+        text="See [@DocY].", statement_id="s2", grounds_index=grounds_index
+    )
+
+    assert type(grounds_index) is dict
+    assert [link.ground_id for link in first.links] == ["file_1", "file_2"]
+    assert [link.ground_id for link in second.links] == ["file_3"]
+    assert set(grounds_index) == {"DocX", "DocY"}
+
+
+def test_build_links_from_grounds_rejects_grounds_with_prebuilt_index():
+    grounds = [Ground(citation_key="DocX", ground_id="file_1")]
+
+    with pytest.raises(ValueError, match="grounds_index"):
+        build_links_from_grounds(
+            text="See [@DocX].",
+            statement_id="s1",
+            grounds=grounds,
+            grounds_index=index_grounds(grounds),
+        )
+
+
+def test_build_links_from_grounds_matches_validated_models():
+    ground = Ground(citation_key="DocX", ground_id="file_1", signature="sig")
+    link_set = build_links_from_grounds(text="[@DocX]", grounds=[ground], statement_id="s1")
+
+    revalidated = LinkSet.model_validate(link_set.model_dump())
+    assert revalidated == link_set
+    assert link_set.links[0].provenance.evidence_content == "citation_key=DocX"
+
+
 def test_grounds_from_tool_call_refs_expands_multiple_grounds():
     grounds = grounds_from_tool_call_refs(
         {
@@ -77,3 +77,14 @@ def test_aggregate_accepts_all_acceptable():
     )
     assert result.status == EvaluationStatus.ACCEPTABLE
     assert result.num_acceptable == 2
+
+
+def test_aggregate_mixed_conditional_counts_all_acceptable():
+    evaluator = AdmissibilityEvaluator()
+    result = evaluator._aggregate(
+        _results(EvaluationStatus.CONDITIONALLY_ACCEPTABLE, EvaluationStatus.ACCEPTABLE),
+        _statement_results(2),
+    )
+    assert result.status == EvaluationStatus.CONDITIONALLY_ACCEPTABLE
+    assert result.explanation == "Mix of conditional and acceptable statements"
+    assert result.num_acceptable == 2
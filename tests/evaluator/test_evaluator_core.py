@@ -1,4 +1,5 @@
 from normcore.evaluator import AdmissibilityEvaluator
+from normcore.models import AdmissibilityJudgment
 from normcore.normative.models import (
     EvaluationStatus,
     GroundSet,
@@ -82,3 +83,4 @@ def test_to_judgment_maps_status_and_statement_data():
     assert judgment.statement_evaluations[0].statement_id == "s1"
     assert judgment.grounds_accepted == 3
     assert judgment.grounds_cited == 2
+    assert AdmissibilityJudgment.model_validate(judgment.model_dump()) == judgment
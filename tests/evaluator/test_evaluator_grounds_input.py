@@ -30,6 +30,39 @@ def test_coerce_grounds_accepts_openai_annotations_payload():
     assert grounds[0].ground_id == "file_from_grounds"
 
 
+def test_coerce_grounds_routes_openai_dicts_without_grounds_validation(monkeypatch):
+    import normcore.citations.grounds as grounds_module
+
+    def fail_parse_grounds(_payload):
+        raise AssertionError("OpenAI-tagged payload must not be validated as grounds")
+
+    monkeypatch.setattr(grounds_module, "parse_grounds", fail_parse_grounds)
+    grounds = coerce_grounds_input(
+        grounds=[
+            {
+                "type": "url_citation",
+                "url": "https://example.com/doc",
+                "title": "Doc",
+                "start_index": 0,
+                "end_index": 3,
+            }
+        ],
+    )
+    assert [g.ground_id for g in grounds] == ["https://example.com/doc"]
+
+
+def test_coerce_grounds_accepts_explicit_grounds_with_openai_type_tag():
+    grounds = coerce_grounds_input(
+        grounds=[{"citation_key": "k", "ground_id": "g", "type": "file_citation"}],
+    )
+    assert grounds == [Ground(citation_key="k", ground_id="g")]
+
+
+def test_coerce_grounds_invalid_openai_payload_is_ignored():
+    grounds = coerce_grounds_input(grounds=[{"type": "file_citation"}])
+    assert grounds == []
+
+
 def test_coerce_grounds_adds_legacy_openai_citations():
     grounds = coerce_grounds_input(
         grounds=[Ground(citation_key="local", ground_id="g1")],
@@ -85,6 +85,27 @@ def test_extract_tool_results_from_trajectory():
     assert results[1].result_text == "ok"
 
 
+def test_extract_tool_results_resolves_tool_message_before_its_call():
+    evaluator = AdmissibilityEvaluator()
+    trajectory = [
+        {"role": "tool", "tool_call_id": "call1", "content": "early"},
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {
+                    "id": "call1",
+                    "type": "function",
+                    "function": {"name": "search", "arguments": "{}"},
+                }
+            ],
+        },
+    ]
+
+    results = evaluator._extract_tool_results(trajectory)
+    assert [(r.tool_name, r.result_text) for r in results] == [("search", "early")]
+
+
 def test_map_tool_call_custom():
     evaluator = AdmissibilityEvaluator()
     tool_call = {
@@ -94,3 +115,35 @@ def test_map_tool_call_custom():
     }
     mapped = evaluator._map_tool_call(tool_call)
     assert mapped.name == "my_tool"
+
+
+def test_evaluator_instances_share_type_adapters():
+    first = AdmissibilityEvaluator()
+    second = AdmissibilityEvaluator()
+
+    assert first._trajectory_adapter is second._trajectory_adapter
+    assert first._assistant_adapter is second._assistant_adapter
+    assert first._content_parts_adapter is second._content_parts_adapter
+
+
+def test_shared_evaluator_is_reused_per_class():
+    class CustomEvaluator(AdmissibilityEvaluator):
+        pass
+
+    assert AdmissibilityEvaluator._shared() is AdmissibilityEvaluator._shared()
+    assert CustomEvaluator._shared() is CustomEvaluator._shared()
+    assert type(CustomEvaluator._shared()) is CustomEvaluator
+    assert CustomEvaluator._shared() is not AdmissibilityEvaluator._shared()
+
+
+def test_map_content_accepts_sequences_and_lazy_iterables():
+    evaluator = AdmissibilityEvaluator()
+    part = {"type": "text", "text": "a"}
+
+    assert evaluator._map_content([part]) == [_TextPart(type="text", text="a")]
+    assert evaluator._map_content((part,)) == [_TextPart(type="text", text="a")]
+    assert evaluator._map_content(iter([part])) == [_TextPart(type="text", text="a")]
+    with pytest.raises(ValueError):
+        evaluator._map_content(42)
+    with pytest.raises(ValueError):
+        evaluator._map_content([{"type": "image", "text": "a"}])
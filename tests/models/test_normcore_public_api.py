@@ -1,3 +1,4 @@
+import importlib
 import json
 import sys
 
@@ -13,10 +14,27 @@ def test_normcore_namespace_does_not_export_evaluator_class():
     assert not hasattr(normcore, "AdmissibilityEvaluator")
 
 
+def test_normcore_dir_lists_public_exports_only():
+    assert dir(normcore) == sorted(normcore.__all__)
+
+
 def test_normcore_namespace_exports_evaluate():
     assert namespaced_evaluate is evaluate
 
 
+@pytest.mark.parametrize(
+    "module", ["normcore.cli", "normcore.models", "normcore.citations", "normcore.evaluator"]
+)
+def test_normcore_submodule_import_does_not_load_openai_sdk(module, monkeypatch):
+    for name in list(sys.modules):
+        if name.split(".")[0] in {"openai", "normcore"}:
+            monkeypatch.delitem(sys.modules, name)
+
+    importlib.import_module(module)
+
+    assert "openai" not in sys.modules
+
+
 def test_normcore_cli_help_runs(monkeypatch, capsys):
     monkeypatch.setattr(sys, "argv", ["normcore"])
     assert cli_main() == 0
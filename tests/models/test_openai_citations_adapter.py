@@ -1,4 +1,7 @@
+from types import SimpleNamespace
+
 from openai.types.responses.response_output_text import (
+    Annotation,
     AnnotationFileCitation,
     AnnotationURLCitation,
 )
@@ -7,6 +10,14 @@ from normcore.citations import link_set_from_openai_citations, parse_openai_cita
 from normcore.models import LinkRole
 
 
+def test_openai_citation_alias_resolves_to_sdk_annotation():
+    from normcore.citations import OpenAICitation
+    from normcore.models import OpenAICitation as LegacyOpenAICitation
+
+    assert OpenAICitation is Annotation
+    assert LegacyOpenAICitation is Annotation
+
+
 def test_link_set_from_openai_citations_uses_ground_id():
     citations = [
         AnnotationFileCitation(
@@ -55,3 +66,73 @@ def test_parse_openai_citations_validates_against_openai_schema():
 
     assert len(citations) == 1
     assert citations[0].type == "file_citation"
+
+
+def test_parse_openai_citations_accepts_non_list_iterables():
+    payload = {
+        "type": "url_citation",
+        "url": "https://example.com",
+        "title": "Example",
+        "start_index": 0,
+        "end_index": 1,
+    }
+
+    citations = parse_openai_citations(item for item in [payload])
+
+    assert [citation.url for citation in citations] == ["https://example.com"]
+
+
+def test_link_set_from_openai_citations_renders_compact_evidence():
+    citations = [
+        AnnotationURLCitation(
+            type="url_citation",
+            url="https://example.com/ü",
+            title="Doc",
+            start_index=0,
+            end_index=10,
+        )
+    ]
+
+    link_set = link_set_from_openai_citations(citations)
+
+    assert link_set.links[0].provenance.evidence_content == (
+        'openai_citation[0]={"end_index":10,"start_index":0,"title":"Doc",'
+        '"type":"url_citation","url":"https://example.com/ü"}'
+    )
+
+
+def test_link_set_from_openai_citations_coerces_enum_arguments():
+    citations = [
+        AnnotationFileCitation(type="file_citation", file_id="file_1", filename="a.md", index=0)
+    ]
+
+    link_set = link_set_from_openai_citations(citations, role="disambiguates")
+
+    assert link_set.links[0].role is LinkRole.DISAMBIGUATES
+
+
+def test_link_set_from_openai_citations_sorts_extra_fields_in_evidence():
+    citation = AnnotationURLCitation.model_validate(
+        {
+            "type": "url_citation",
+            "url": "u",
+            "title": "t",
+            "start_index": 0,
+            "end_index": 1,
+            "zextra": 1,
+            "aextra": "x",
+        }
+    )
+
+    link_set = link_set_from_openai_citations([citation])
+
+    assert link_set.links[0].provenance.evidence_content == (
+        'openai_citation[0]={"aextra":"x","end_index":1,"start_index":0,"title":"t",'
+        '"type":"url_citation","url":"u","zextra":1}'
+    )
+
+
+def test_link_set_from_openai_citations_skips_citation_without_id_field():
+    citation = SimpleNamespace(type="url_citation", title="Doc")
+
+    assert link_set_from_openai_citations([citation]).links == []
@@ -13,7 +13,7 @@ from normcore.models import (
     TextSpeechAct,
 )
 from normcore.models.links import CreatorType, EvidenceType
-from normcore.models.messages import ToolResultSpeechAct, _TextPart
+from normcore.models.messages import ToolResultSpeechAct, _AssistantMessage, _TextPart
 
 
 def test_public_model_roundtrip():
@@ -56,6 +56,12 @@ def test_text_part_forbids_extra_fields():
         raise AssertionError("Expected ValidationError for extra fields")
 
 
+def test_mapped_message_wrappers_are_slotted():
+    message = _AssistantMessage(content="hi")
+    assert message.tool_calls == []
+    assert not hasattr(message, "__dict__")
+
+
 def test_links_models_defaults():
     provenance = Provenance(
         creator=CreatorType.HUMAN,
@@ -1,6 +1,7 @@
 import json
 
 from normcore.models.messages import ToolResultSpeechAct
+from normcore.normative import knowledge_builder
 from normcore.normative.knowledge_builder import KnowledgeStateBuilder
 from normcore.normative.models import Scope, Source, Status
 
@@ -58,3 +59,41 @@ def test_stable_id_fragment_is_deterministic():
     builder = KnowledgeStateBuilder()
     value = "same-input"
     assert builder._stable_id_fragment(value) == builder._stable_id_fragment(value)
+
+
+def test_extract_entity_id_prefers_key_over_earlier_id_field():
+    builder = KnowledgeStateBuilder()
+    data = {"project_id": "P-1", "empty_key": "", "issue_key": "AGENT-8", "user_id": "u1"}
+    assert builder._extract_entity_id(data) == "issue_AGENT-8"
+    assert builder._extract_entity_id({"empty_key": "", "project_id": "P-1"}) == "project_P-1"
+    assert builder._extract_entity_id({"name": "x", "my-field_key": "v"}) is None
+
+
+def test_extract_semantic_id_returns_fresh_list_for_repeated_content():
+    builder = KnowledgeStateBuilder()
+    payload = json.dumps([{"task_key": "T-1"}, {"task_key": "T-2"}])
+    first = builder._extract_semantic_id(_tool_result("search_tasks", payload))
+    first.append("mutated")
+    second = builder._extract_semantic_id(_tool_result("search_tasks", payload))
+    assert second == ["task_T-1", "task_T-2"]
+
+
+def test_extract_semantic_id_ignores_plain_text_and_scalars():
+    builder = KnowledgeStateBuilder()
+    for text in ("Build passed on main", '"issue_key"', "42", "  \n", "{not json"):
+        assert builder._extract_semantic_id(_tool_result("run_tests", text)) is None
+    payload = '  \n{"issue_key": "AGENT-8"}'
+    assert builder._extract_semantic_id(_tool_result("get_issue", payload)) == "issue_AGENT-8"
+
+
+def test_extract_semantic_id_does_not_cache_large_content():
+    builder = KnowledgeStateBuilder()
+    items = [{"task_key": f"T-{n}"} for n in range(500)]
+    payload = json.dumps(items)
+    assert len(payload) > knowledge_builder._MAX_CACHED_CONTENT_LENGTH
+    before = knowledge_builder._cached_semantic_ids.cache_info().currsize
+
+    semantic_ids = builder._extract_semantic_id(_tool_result("search_tasks", payload))
+
+    assert semantic_ids == [f"task_T-{n}" for n in range(500)]
+    assert knowledge_builder._cached_semantic_ids.cache_info().currsize == before
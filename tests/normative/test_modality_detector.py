@@ -72,3 +72,10 @@ def test_detect_with_conditions_does_not_extract_for_assertive_tail_if():
     detector.detect_with_conditions(statement)
     assert statement.modality == Modality.ASSERTIVE
     assert statement.conditions == []
+
+
+def test_detectors_share_compiled_indicators():
+    first = ModalityDetector()
+    second = ModalityDetector()
+    assert first._refusal_re is second._refusal_re
+    assert first._recommendation_re is second._recommendation_re
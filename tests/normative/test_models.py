@@ -61,6 +61,17 @@ def test_ground_set_resolve_by_id_or_semantic_id():
     assert ground_set.resolve_ground("sem1") == node
 
 
+def test_ground_set_index_matches_resolve_precedence():
+    first = _node("n1", semantic_id="shared")
+    second = _node("shared", semantic_id="n1")
+    third = _node("n3", semantic_id="shared")
+    ground_set = GroundSet(nodes=[first, second, third])
+
+    index = ground_set.ground_index()
+    for ground_id in ("n1", "shared", "n3", "missing"):
+        assert index.get(ground_id) is ground_set.resolve_ground(ground_id)
+
+
 def test_license_permits():
     license = License(permitted_modalities={Modality.ASSERTIVE})
     assert license.permits(Modality.ASSERTIVE)